@@ -1,232 +1,414 @@
 #!/usr/bin/env python3
 import re
-import requests
 import argparse
-import semver
-import multiprocessing
+import functools
+import hashlib
+import io
 import subprocess
 import sys
 import os
 
-def get_forge_release_data(release_slug):
+_MOD_RE = re.compile(r"mod\s+'([^']+)',\s+:git\s*=>\s*'([^']+)',\s*:tag\s*=>\s*'([^']+)'")
+_REQ_RE = re.compile(r'([<>=]+)\s*([\d.]+)')
+_TUPLE_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)')
+
+_BOLD = '\033[1m'
+_ORANGE = '\033[38;5;208m'
+_RESET = '\033[0m'
+_OUTDATED = f'{_ORANGE}[Outdated]{_RESET}'
+_NOT_FOUND = f'\033[31m[Not Found]{_RESET}'
+
+@functools.lru_cache(maxsize=None)
+def _semver_cmp(a, b):
+    """Cached semver.compare; the same version pairs recur across modules."""
+    import semver
+    return semver.compare(a, b)
+
+@functools.lru_cache(maxsize=None)
+def _to_tuple(version):
+    """Parses a plain x.y.z version into an int tuple, or None for anything richer."""
+    match = _TUPLE_RE.fullmatch(version)
+    if match:
+        return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    return None
+
+def _version_cmp(a, b):
+    """Compares two versions as int tuples, falling back to semver for non-x.y.z forms."""
+    tuple_a = _to_tuple(a)
+    tuple_b = _to_tuple(b)
+    if tuple_a is not None and tuple_b is not None:
+        return (tuple_a > tuple_b) - (tuple_a < tuple_b)
+    return _semver_cmp(a, b)
+
+@functools.lru_cache(maxsize=None)
+def _semver_parse(s):
+    """Cached semver.VersionInfo.parse."""
+    import semver
+    return semver.VersionInfo.parse(s)
+
+def _scan_mod_line(line):
+    """Extracts (module_name, git_url, tag) from a canonical mod line with plain string scanning."""
+    fields = []
+    separators = []
+    pos = 0
+    try:
+        for _ in range(3):
+            start = line.index("'", pos) + 1
+            end = line.index("'", start)
+            separators.append(line[pos:start - 1])
+            fields.append(line[start:end])
+            pos = end + 1
+    except ValueError:
+        return None
+    if ':git' not in separators[1] or ':tag' not in separators[2]:
+        return None
+    return tuple(fields)
+
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'puppetfile-check')
+try:
+    _MAX_CACHE_ENTRIES = int(os.environ.get('PUPPETFILE_CHECK_MAX_CACHE_SIZE', '256'))
+except ValueError:
+    _MAX_CACHE_ENTRIES = 256
+_run_memo = {}
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_decode_pool = None
+
+def _get_decode_pool():
+    """Returns the shared thread pool used to decode responses off the event loop."""
+    global _decode_pool
+    if _decode_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _decode_pool = ThreadPoolExecutor(max_workers=4)
+    return _decode_pool
+
+def _cache_path(url):
+    """Returns the on-disk cache file path for an API URL."""
+    return os.path.join(_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + '.json')
+
+def _cache_read(url):
+    """Reads a cached {etag, data} entry for the URL, or None."""
+    import orjson
+    try:
+        with open(_cache_path(url), 'rb') as f:
+            return orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+def _cache_write(url, etag, data):
+    """Stores a {etag, data} entry for the URL and prunes the oldest entries."""
+    import orjson
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_cache_path(url), 'wb') as f:
+            f.write(orjson.dumps({'etag': etag, 'data': data}))
+        entries = [os.path.join(_CACHE_DIR, name) for name in os.listdir(_CACHE_DIR)]
+        if len(entries) > _MAX_CACHE_ENTRIES:
+            entries.sort(key=os.path.getmtime)
+            for path in entries[:len(entries) - _MAX_CACHE_ENTRIES]:
+                os.remove(path)
+    except OSError:
+        pass
+
+async def _fetch_json(session, url):
+    """Fetches JSON from the Forge, revalidating the disk cache via ETag."""
+    import asyncio
+    import orjson
+    if url in _run_memo:
+        return _run_memo[url]
+    cached = _cache_read(url)
+    headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+    for attempt in range(_RETRY_TOTAL):
+        async with session.get(url, headers=headers) as response:
+            if response.status in _RETRY_STATUSES and attempt < _RETRY_TOTAL - 1:
+                await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+                continue
+            if response.status == 304 and cached:
+                _run_memo[url] = cached['data']
+                return cached['data']
+            response.raise_for_status()
+            raw = await response.read()
+            data = await asyncio.get_running_loop().run_in_executor(_get_decode_pool(), orjson.loads, raw)
+            break
+    etag = response.headers.get('ETag')
+    if etag:
+        _cache_write(url, etag, data)
+    _run_memo[url] = data
+    return data
+
+async def get_forge_release_data(session, release_slug):
     """Queries the Puppet Forge API for release data using release slug."""
+    import aiohttp
+    import asyncio
     try:
         api_url = f"https://forgeapi.puppet.com/v3/releases/{release_slug}"
-        response = requests.get(api_url)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return await _fetch_json(session, api_url)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"Error fetching data for {release_slug}: {e}")
         return None
 
-def get_forge_module_data(module_name):
-    """Queries the Puppet Forge API for module data."""
-    try:
-        if module_name == 'puppet-resource_tree':
-            module_name = 'jake-resource_tree'
-        api_url = f"https://forgeapi.puppet.com/v3/modules/{module_name}"
-        response = requests.get(api_url)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching data for {module_name}: {e}")
-        return None
+def _forge_name(module_name):
+    """Maps a Puppetfile module name to its slug on the Forge."""
+    if module_name == 'puppet-resource_tree':
+        return 'jake-resource_tree'
+    return module_name
+
+async def get_forge_modules_batch(session, module_names):
+    """Queries the Puppet Forge modules endpoint in batches of 100, keyed by slug."""
+    import aiohttp
+    import asyncio
+    modules = {}
+    names = list(module_names)
+    for i in range(0, len(names), 100):
+        chunk = names[i:i + 100]
+        try:
+            api_url = f"https://forgeapi.puppet.com/v3/modules?limit=100&module={','.join(chunk)}"
+            batch_data = await _fetch_json(session, api_url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching module batch: {e}")
+            continue
+        for result in batch_data.get('results', []):
+            modules[result['slug']] = result
+    return modules
 
-def fetch_module_data(module_info):
-    """Fetches module data from the Forge API using release slug and verifies against module endpoint."""
+def _build_module_result(tag, forge_release_data, module_endpoint_version):
+    """Normalizes release metadata into the result payload; runs in the decode pool."""
+    current_version = forge_release_data.get('version')
+    metadata = forge_release_data.get('metadata', {})
+    dependencies = metadata.get('dependencies', [])
+    return {
+        'tag': tag,
+        'current_version': current_version,
+        'dependency_requirements': {dep['name'].replace('/', '-'): dep['version_requirement'] for dep in dependencies},
+        'module_endpoint_version': module_endpoint_version
+    }
+
+async def fetch_module_data(session, semaphore, module_info, forge_module_data):
+    """Resolves module version and dependency metadata, fetching the release only when the tag is not current."""
     module_name, data = module_info
-    if not data['git_url'].startswith("https://github.com/"):
+    if not forge_module_data:
+        print(f"Skipping {module_name} due to fetch error.")
         return module_name, None
-    release_slug = f"{module_name}-{data['tag']}"
-    if module_name == 'puppet-resource_tree':
-        release_slug = f"jake-resource_tree-{data['tag']}"
-    forge_release_data = get_forge_release_data(release_slug)
-    forge_module_data = get_forge_module_data(module_name)
-    if forge_release_data and forge_module_data:
-        current_version = forge_release_data.get('version')
-        metadata = forge_release_data.get('metadata', {})
-        dependencies = metadata.get('dependencies', [])
-        module_endpoint_version = forge_module_data.get('current_release', {}).get('version')
-        return module_name, {
-            'tag': data['tag'],
-            'current_version': current_version,
-            'dependencies': dependencies,
-            'module_endpoint_version': module_endpoint_version
-        }
+    current_release = forge_module_data.get('current_release', {})
+    module_endpoint_version = current_release.get('version')
+    if data['tag'] == module_endpoint_version:
+        forge_release_data = current_release
+    else:
+        release_slug = f"{_forge_name(module_name)}-{data['tag']}"
+        async with semaphore:
+            forge_release_data = await get_forge_release_data(session, release_slug)
+    if forge_release_data:
+        import asyncio
+        result = await asyncio.get_running_loop().run_in_executor(
+            _get_decode_pool(), _build_module_result, data['tag'], forge_release_data, module_endpoint_version)
+        return module_name, result
     else:
         print(f"Skipping {module_name} due to fetch error.")
         return module_name, None
 
-def main():
-    parser = argparse.ArgumentParser(description="Check Puppetfile dependencies against Puppet Forge.")
-    parser.add_argument("puppetfile_path", nargs="?", default="Puppetfile", help="Path to the Puppetfile.") #Add this line
-    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output.")
-    parser.add_argument("-a", "--print-all", action="store_true", help="Print all modules and dependencies.")
-    args = parser.parse_args()
+def _puppetfile_changed():
+    """Checks whether Puppetfile differs from HEAD, via pygit2 when available."""
+    try:
+        from pygit2 import (
+            Repository,
+            GIT_STATUS_INDEX_MODIFIED,
+            GIT_STATUS_INDEX_NEW,
+            GIT_STATUS_WT_MODIFIED,
+            GIT_STATUS_WT_NEW,
+        )
+    except ImportError:
+        result = subprocess.run(['git', 'diff', '--name-only', 'HEAD', 'Puppetfile'], capture_output=True, text=True)
+        return 'Puppetfile' in result.stdout.splitlines()
+    changed = GIT_STATUS_INDEX_MODIFIED | GIT_STATUS_INDEX_NEW | GIT_STATUS_WT_MODIFIED | GIT_STATUS_WT_NEW
+    return bool(Repository('.').status().get('Puppetfile', 0) & changed)
 
-    def parse_r10k_puppetfile(puppetfile_path):
-        """Parses Puppetfile and extracts module, git URL, and tag."""
-        module_data = {}
-        invalid_tags = []
-        try:
-            with open(puppetfile_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    match = re.search(r"mod\s+'([^']+)',\s+:git\s*=>\s*'([^']+)',\s*:tag\s*=>\s*'([^']+)'", line)
-                    if match:
-                        module_name = match.group(1)
-                        git_url = match.group(2)
-                        tag = re.sub(r'^v', '', match.group(3), flags=re.IGNORECASE)
-                        try:
-                            semver.VersionInfo.parse(tag)
-                            module_data[module_name] = {'tag': tag, 'git_url': git_url}
-                        except ValueError:
-                            invalid_tags.append((module_name, tag))
-        except FileNotFoundError:
-            print(f"Error: Puppetfile not found at {puppetfile_path}")
-        except Exception as e:
-            print(f"An error occurred: {e}")
-
-        if invalid_tags:
-            print("The following modules have invalid semver tags and were skipped:")
-            for module, tag in invalid_tags:
-                print(f"  - {module}: {tag}")
-        return module_data
-
-    def get_current_release_and_metadata(module_data):
-        """Gets current release version and metadata from Forge data using multiprocessing."""
-        results = {}
-        with multiprocessing.Pool() as pool:
-            module_infos = list(module_data.items())
-            module_results = pool.map(fetch_module_data, module_infos)
-            for module_name, module_result in module_results:
-                if module_result:
-                    results[module_name] = module_result
-        return results
-
-    def compare_modules(puppetfile_modules, forge_modules):
-        """Compares modules in Puppetfile and Forge, showing differences."""
-        differences = {}
-        for module_name, forge_info in forge_modules.items():
-            puppet_tag = puppetfile_modules[module_name]['tag']
-            forge_version = forge_info['current_version']
-
-            if puppet_tag != forge_version:
-                differences[module_name] = {
-                    'puppet_tag': puppet_tag,
-                    'forge_version': forge_version,
-                    'forge_dependencies': forge_info['dependencies'],
-                    'module_endpoint_version': forge_info['module_endpoint_version']
-                }
-            else:
-                forge_deps = {dep['name'].replace('/', '-'): dep['version_requirement'] for dep in forge_info['dependencies']}
-                differences[module_name] = {
-                    'puppet_tag': puppet_tag,
-                    'forge_version': forge_version,
-                    'forge_dependencies': forge_info['dependencies'],
-                    'module_endpoint_version': forge_info['module_endpoint_version']
-                }
-        return differences
-
-    def compare_versions(puppet_dep_version, dep_version_requirement):
-        """Compares a Puppetfile dependency version with a Forge dependency version requirement."""
-        requirements = re.findall(r'([<>=]+)\s*([\d.]+)', dep_version_requirement)
-        if not requirements:
-            try:
-                result = semver.match(puppet_dep_version, dep_version_requirement)
-                return result
-            except ValueError:
-                return False
+async def gather_all(module_data):
+    """Fetches all module data concurrently over one shared HTTP session."""
+    import aiohttp
+    import asyncio
+    semaphore = asyncio.Semaphore(16)
+    connector = aiohttp.TCPConnector(limit=16)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        forge_modules = await get_forge_modules_batch(session, (_forge_name(name) for name in module_data))
+        tasks = [
+            fetch_module_data(session, semaphore, module_info, forge_modules.get(_forge_name(module_info[0])))
+            for module_info in module_data.items()
+        ]
+        return await asyncio.gather(*tasks)
 
-        for operator, version in requirements:
+def parse_r10k_puppetfile(puppetfile_path):
+    """Parses Puppetfile and extracts module, git URL, and tag."""
+    module_data = {}
+    invalid_tags = []
+    try:
+        with open(puppetfile_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        for raw in content.splitlines():
+            line = raw.lstrip()
+            if not (line.startswith('mod') and line[3:4].isspace()):
+                continue
+            fields = _scan_mod_line(line)
+            if fields is None:
+                match = _MOD_RE.search(line)
+                if not match:
+                    continue
+                fields = match.groups()
+            module_name, git_url, tag = fields
+            if tag[:1] in ('v', 'V'):
+                tag = tag[1:]
             try:
-                if operator == '>=':
-                    result = semver.compare(puppet_dep_version, version) >= 0
-                    if not result:
-                        return False
-                elif operator == '>':
-                    result = semver.compare(puppet_dep_version, version) > 0
-                    if not result:
-                        return False
-                elif operator == '<=':
-                    result = semver.compare(puppet_dep_version, version) <= 0
-                    if not result:
-                        return False
-                elif operator == '<':
-                    result = semver.compare(puppet_dep_version, version) < 0
-                    if not result:
-                        return False
-                elif operator == '=':
-                    result = semver.compare(puppet_dep_version, version) == 0
-                    if not result:
-                        return False
+                _semver_parse(tag)
+                module_data[module_name] = {'tag': tag, 'git_url': git_url}
             except ValueError:
-                return False
-        return True
-
-    def print_differences(module_differences, puppetfile_modules, verbose=False, print_all=False):
-        """Prints module differences with color-coded status."""
-        has_errors = False
-        for module, diff in module_differences.items():
-            puppet_tag = diff['puppet_tag']
-            forge_version = diff['module_endpoint_version'] #Change to use module_endpoint_version
-            outdated_version = "[Outdated]" if puppet_tag != forge_version else ""
-            orange_outdated = f"\033[38;5;208m{outdated_version}\033[0m" if outdated_version else ""
-
-            forge_deps = diff['forge_dependencies']
-            puppet_deps = {k: v['tag'] for k, v in puppetfile_modules.items()}
-
-            module_has_errors = False
-            dependency_lines = []
-
-            for dep in forge_deps:
-                dep_name = dep['name'].replace('/', '-')
-                dep_version = dep['version_requirement']
-
-                if dep_name not in puppet_deps:
-                    not_found = "[Not Found]"
-                    red_not_found = f"\033[31m{not_found}\033[0m"
-                    dependency_lines.append(f"    - {dep_name} ({dep_version}) {red_not_found} {orange_outdated if outdated_version else ''}")
+                invalid_tags.append((module_name, tag))
+    except FileNotFoundError:
+        print(f"Error: Puppetfile not found at {puppetfile_path}")
+    except Exception as e:
+        print(f"An error occurred: {e}")
+
+    if invalid_tags:
+        print("The following modules have invalid semver tags and were skipped:")
+        for module, tag in invalid_tags:
+            print(f"  - {module}: {tag}")
+    return module_data
+
+def get_current_release_and_metadata(module_data):
+    """Gets current release version and metadata from Forge data using asyncio."""
+    import asyncio
+    results = {}
+    github_modules = {
+        name: data for name, data in module_data.items()
+        if data['git_url'].startswith("https://github.com/")
+    }
+    module_results = asyncio.run(gather_all(github_modules))
+    for module_name, module_result in module_results:
+        if module_result:
+            results[module_name] = module_result
+    return results
+
+def compare_modules(puppetfile_modules, forge_modules, print_all=False):
+    """Compares modules in Puppetfile and Forge, showing differences."""
+    differences = {}
+    for module_name, forge_info in forge_modules.items():
+        puppet_tag = puppetfile_modules[module_name]['tag']
+        forge_version = forge_info['current_version']
+
+        up_to_date = puppet_tag == forge_info['module_endpoint_version']
+        if up_to_date and not forge_info['dependency_requirements'] and not print_all:
+            continue
+        differences[module_name] = {
+            'puppet_tag': puppet_tag,
+            'forge_version': forge_version,
+            'dependency_requirements': forge_info['dependency_requirements'],
+            'module_endpoint_version': forge_info['module_endpoint_version']
+        }
+    return differences
+
+def compare_versions(puppet_dep_version, dep_version_requirement):
+    """Compares a Puppetfile dependency version with a Forge dependency version requirement."""
+    requirements = _REQ_RE.findall(dep_version_requirement)
+    if not requirements:
+        import semver
+        try:
+            result = semver.match(puppet_dep_version, dep_version_requirement)
+            return result
+        except ValueError:
+            return False
+
+    for operator, version in requirements:
+        try:
+            if operator == '>=':
+                result = _version_cmp(puppet_dep_version, version) >= 0
+                if not result:
+                    return False
+            elif operator == '>':
+                result = _version_cmp(puppet_dep_version, version) > 0
+                if not result:
+                    return False
+            elif operator == '<=':
+                result = _version_cmp(puppet_dep_version, version) <= 0
+                if not result:
+                    return False
+            elif operator == '<':
+                result = _version_cmp(puppet_dep_version, version) < 0
+                if not result:
+                    return False
+            elif operator == '=':
+                result = _version_cmp(puppet_dep_version, version) == 0
+                if not result:
+                    return False
+        except ValueError:
+            return False
+    return True
+
+def print_differences(module_differences, puppetfile_modules, verbose=False, print_all=False):
+    """Prints module differences with color-coded status."""
+    has_errors = False
+    puppet_deps = {k: v['tag'] for k, v in puppetfile_modules.items()}
+    cmp_cache = {}
+    out = io.StringIO()
+    for module, diff in module_differences.items():
+        puppet_tag = diff['puppet_tag']
+        forge_version = diff['module_endpoint_version'] #Change to use module_endpoint_version
+        if not diff['dependency_requirements'] and puppet_tag == forge_version and not print_all:
+            continue
+        outdated_version = "[Outdated]" if puppet_tag != forge_version else ""
+        orange_outdated = _OUTDATED if outdated_version else ""
+
+        module_has_errors = False
+        dependency_lines = []
+
+        for dep_name, dep_version in diff['dependency_requirements'].items():
+            if dep_name not in puppet_deps:
+                dependency_lines.append(f"    - {dep_name} ({dep_version}) {_NOT_FOUND} {orange_outdated}")
+                module_has_errors = True
+                has_errors = True
+                if verbose:
+                    out.write(f"Debug: Not Found - {dep_name}\n")
+            else:
+                puppet_dep_version = puppet_deps.get(dep_name)
+                cache_key = (puppet_dep_version, dep_version)
+                if cache_key not in cmp_cache:
+                    cmp_cache[cache_key] = compare_versions(puppet_dep_version, dep_version)
+                if not cmp_cache[cache_key]:
+                    dependency_lines.append(f"    - {dep_name} ({dep_version}) {_ORANGE}[Invalid - Provided:{puppet_dep_version}]{_RESET}")
                     module_has_errors = True
                     has_errors = True
                     if verbose:
-                        print(f"Debug: Not Found - {dep_name}")
+                        out.write(f"Debug: Invalid - {dep_name}\n")
                 else:
-                    puppet_dep_version = puppet_deps.get(dep_name)
-                    if not compare_versions(puppet_dep_version, dep_version):
-                        invalid_version = f"[Invalid - Provided:{puppet_dep_version}]"
-                        orange_invalid = f"\033[38;5;208m{invalid_version}\033[0m"
-                        dependency_lines.append(f"    - {dep_name} ({dep_version}) {orange_invalid}")
-                        module_has_errors = True
-                        has_errors = True
-                        if verbose:
-                            print(f"Debug: Invalid - {dep_name}")
-                    else:
-                        dependency_lines.append(f"    - {dep_name} ({dep_version})")
-
-            if module_has_errors or outdated_version or print_all:
-                print(f"\033[1mModule: {module}\033[0m")
-                print(f"    Puppetfile Tag: {puppet_tag}")
-                print(f"    Forge Version: {forge_version} {orange_outdated}")
-                if dependency_lines or print_all:
-                    print("    Forge Dependencies:")
-                    for line in dependency_lines:
-                        print(line)
-                print("-" * 20)
-                if verbose:
-                    print(f"Debug: module_has_errors: {module_has_errors}, outdated_version: {outdated_version}")
-                    print(f"Debug: has_errors: {has_errors}")
+                    dependency_lines.append(f"    - {dep_name} ({dep_version})")
 
-        return has_errors
+        if module_has_errors or outdated_version or print_all:
+            out.write(f"{_BOLD}Module: {module}{_RESET}\n")
+            out.write(f"    Puppetfile Tag: {puppet_tag}\n")
+            out.write(f"    Forge Version: {forge_version} {orange_outdated}\n")
+            if dependency_lines or print_all:
+                out.write("    Forge Dependencies:\n")
+                for line in dependency_lines:
+                    out.write(line + "\n")
+            out.write("-" * 20 + "\n")
+            if verbose:
+                out.write(f"Debug: module_has_errors: {module_has_errors}, outdated_version: {outdated_version}\n")
+                out.write(f"Debug: has_errors: {has_errors}\n")
 
-    result = subprocess.run(['git', 'diff', '--name-only', 'HEAD', 'Puppetfile'], capture_output=True, text=True)
-    changed_files = result.stdout.splitlines()
+    sys.stdout.write(out.getvalue())
+    return has_errors
+
+def main():
+    parser = argparse.ArgumentParser(description="Check Puppetfile dependencies against Puppet Forge.")
+    parser.add_argument("puppetfile_path", nargs="?", default="Puppetfile", help="Path to the Puppetfile.") #Add this line
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output.")
+    parser.add_argument("-a", "--print-all", action="store_true", help="Print all modules and dependencies.")
+    args = parser.parse_args()
 
-    if 'Puppetfile' in changed_files or args.print_all:
+    if _puppetfile_changed() or args.print_all:
         puppetfile_path = 'Puppetfile'
         puppetfile_modules = parse_r10k_puppetfile(puppetfile_path)
         forge_modules = get_current_release_and_metadata(puppetfile_modules)
-        module_differences = compare_modules(puppetfile_modules, forge_modules)
+        module_differences = compare_modules(puppetfile_modules, forge_modules, args.print_all)
 
         has_errors = print_differences(module_differences, puppetfile_modules, args.verbose, args.print_all)
 
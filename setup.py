@@ -7,7 +7,8 @@ setup(
     packages=find_packages(),
     install_requires=[
         'semver',
-        'requests',
+        'aiohttp',
+        'orjson',
     ],
     entry_points={
         'console_scripts': [